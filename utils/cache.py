@@ -1,31 +1,46 @@
 from abc import ABC, abstractmethod
 import networkx as nx
+import numpy as np
 from collections import defaultdict, OrderedDict
+from itertools import count
+from heapq import heappush, heappop, nlargest
 import random
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
 class Cache(ABC):
     def __init__(self, capacity):
         self.capacity = capacity
         self.graph = None
         self.hits = 0
         self.misses = 0
-    
+        self._id = {}
+        self._sizes = []
+
     @abstractmethod
     def initialize(self, graph):
         """Initialize the cache with a graph."""
         self.graph = graph
+        # Map nodes to dense int ids once; queries then hash small ints
+        # instead of arbitrary node keys (relative-path strings for the
+        # analyzer graphs), and sizes become a plain list indexed by id
+        self._id = {node: i for i, node in enumerate(graph.nodes)}
+        self._sizes = [data.get('size') for _, data in graph.nodes(data=True)]
 
     @abstractmethod
     def query(self, node):
         """Query the cache with a node."""
         pass
-    
+
     def name(self, node):
         return self.__name__
-    
+
     @abstractmethod
     def __contains__(self, node):
         pass
-    
+
     @abstractmethod
     def clear(self):
         pass
@@ -46,208 +61,263 @@ class LRUCache(Cache):
     def __init__(self, capacity):
         super().__init__(capacity)
         self.cache = OrderedDict()
-    
+
     def clear(self):
         return self.cache.clear()
 
     def initialize(self, graph):
         self.cache.clear()
         super().initialize(graph)
-        # cache `capacity` random nodes
-        for node in random.sample(sorted(graph.nodes), min(self.capacity, len(graph.nodes))):
-            self.cache[node] = None
+        # cache `capacity` random node ids
+        ids = range(len(self._id))
+        for nid in random.sample(ids, min(self.capacity, len(ids))):
+            self.cache[nid] = None
 
     def query(self, node):
-        if node in self.cache:
+        # Bind the hot attributes once; each query is a handful of dict ops
+        # and the attribute loads are a measurable share of the call
+        nid = self._id[node]
+        cache = self.cache
+        if nid in cache:
             # Cache hit
-            self.hits += self.graph.nodes[node]['size']
+            self.hits += self._sizes[nid]
             # Move the accessed node to the end to show it was recently used
-            self.cache.move_to_end(node)
-            return self.cache[node]
+            cache.move_to_end(nid)
+            return cache[nid]
         else:
             # Cache miss
-            self.misses += self.graph.nodes[node]['size']
-            if len(self.cache) >= self.capacity:
+            self.misses += self._sizes[nid]
+            if len(cache) >= self.capacity:
                 # Remove the least recently used item
-                self.cache.popitem(last=False)
+                cache.popitem(last=False)
             # Add the new node to the cache
-            self.cache[node] = None
-            return self.cache[node]
-    
+            cache[nid] = None
+            return cache[nid]
+
     def __contains__(self, node):
-        return node in self.cache
+        nid = self._id.get(node)
+        return nid is not None and nid in self.cache
 
 class LFUCache(Cache):
     def __init__(self, capacity):
         super().__init__(capacity)
-        self.cache = {}
+        self.cache = set()
         self.freq = defaultdict(int)
-    
+        # Min-heap of (freq, tiebreak, id) entries with lazy deletion;
+        # `self.freq` is the ground truth, stale heap entries are skipped on pop
+        self.heap = []
+        self.counter = count()
+
     def clear(self):
         self.cache.clear()
         self.freq.clear()
-    
+        self.heap.clear()
+
     def initialize(self, graph):
         self.cache.clear()
         self.freq.clear()
+        self.heap.clear()
         super().initialize(graph)
-        # cache `capacity` random nodes
-        for node in random.sample(sorted(graph.nodes), min(self.capacity, len(graph.nodes))):
-            self.cache[node] = None
-            self.freq[node] = 0
+        # cache `capacity` random node ids
+        ids = range(len(self._id))
+        for nid in random.sample(ids, min(self.capacity, len(ids))):
+            self.cache.add(nid)
+            self.freq[nid] = 0
+            heappush(self.heap, (0, next(self.counter), nid))
 
     def query(self, node):
-        if node in self.cache:
+        nid = self._id[node]
+        cache = self.cache
+        freq = self.freq
+        if nid in cache:
             # Cache hit
-            self.hits += self.graph.nodes[node]['size']
-            # Increment the frequency of the node by 'size'
-            self.freq[node] += 1
-            return self.cache[node]
+            self.hits += self._sizes[nid]
+            # Increment the frequency of the node
+            new_freq = freq[nid] + 1
+            freq[nid] = new_freq
+            heappush(self.heap, (new_freq, next(self.counter), nid))
+            return None
         else:
             # Cache miss
-            self.misses += self.graph.nodes[node]['size']
-            if len(self.cache) >= self.capacity:
-                # Find the least frequently used node
-                lfu_node = min(self.freq, key=self.freq.get)
-                # Remove it from the cache and frequency dictionary
-                del self.cache[lfu_node]
-                del self.freq[lfu_node]
+            self.misses += self._sizes[nid]
+            if len(cache) >= self.capacity:
+                # Pop until we find a live entry for the least frequently used node
+                heap = self.heap
+                while heap:
+                    stale_freq, _, lfu_nid = heappop(heap)
+                    if freq.get(lfu_nid) == stale_freq:
+                        # Remove it from the cache and frequency dictionary
+                        cache.discard(lfu_nid)
+                        del freq[lfu_nid]
+                        break
             # Add the new node to the cache and set its frequency to 1
-            self.cache[node] = None
-            self.freq[node] = 1
-            return self.cache[node]
-    
+            cache.add(nid)
+            freq[nid] = 1
+            heappush(self.heap, (1, next(self.counter), nid))
+            return None
+
     def __contains__(self, node):
-        return node in self.cache
+        nid = self._id.get(node)
+        return nid is not None and nid in self.cache
 
 class StaticTopKInDegreeCache(Cache):
     def __init__(self, capacity):
         super().__init__(capacity)
-        self.cache = {}
-    
+        self.cache = np.zeros(0, dtype=bool)
+
     def clear(self):
-        self.cache.clear()
-    
+        self.cache.fill(False)
+
     def initialize(self, graph):
-        self.cache.clear()
         super().initialize(graph)
+        # membership never changes after initialize, so a boolean bitmap
+        # indexed by node id makes each query a single array load
+        self.cache = np.zeros(len(self._id), dtype=bool)
         # cache the top capacity nodes by in-degree
-        for node, degree in sorted(self.graph.in_degree, key=lambda x: x[1], reverse=True)[:self.capacity]:
-            self.cache[node] = None
+        for node, degree in nlargest(self.capacity, self.graph.in_degree, key=lambda x: x[1]):
+            self.cache[self._id[node]] = True
 
     def query(self, node):
-        if node in self.cache:
+        nid = self._id[node]
+        if self.cache[nid]:
             # Cache hit
-            self.hits += self.graph.nodes[node]['size']
-            return self.cache[node]
+            self.hits += self._sizes[nid]
         else:
             # Cache miss
-            self.misses += self.graph.nodes[node]['size']
-            return None
-    
+            self.misses += self._sizes[nid]
+        return None
+
     def __contains__(self, node):
-        return node in self.cache
+        nid = self._id.get(node)
+        return nid is not None and bool(self.cache[nid])
 
 class StaticTopKWeightedInDegreeCache(Cache):
     def __init__(self, capacity):
         super().__init__(capacity)
-        self.cache = {}
-    
+        self.cache = np.zeros(0, dtype=bool)
+
     def clear(self):
-        self.cache.clear()
-    
+        self.cache.fill(False)
+
     def initialize(self, graph):
-        self.cache.clear()
         super().initialize(graph)
-        inDegrees = dict(self.graph.in_degree)
-        weightedInDegrees = {node: inDegrees[node] * self.graph.nodes[node]['size'] for node in self.graph.nodes}
+        self.cache = np.zeros(len(self._id), dtype=bool)
+        # single pass over the in-degree view, weighted by node size
+        weightedInDegrees = ((self._id[node], degree * self._sizes[self._id[node]]) for node, degree in self.graph.in_degree)
         # cache the top capacity nodes by weighted in-degree
-        for node, degree in sorted(weightedInDegrees.items(), key=lambda x: x[1], reverse=True)[:self.capacity]:
-            self.cache[node] = None
+        for nid, degree in nlargest(self.capacity, weightedInDegrees, key=lambda x: x[1]):
+            self.cache[nid] = True
 
     def query(self, node):
-        if node in self.cache:
+        nid = self._id[node]
+        if self.cache[nid]:
             # Cache hit
-            self.hits += self.graph.nodes[node]['size']
-            return self.cache[node]
+            self.hits += self._sizes[nid]
         else:
             # Cache miss
-            self.misses += self.graph.nodes[node]['size']
-            return None
-    
+            self.misses += self._sizes[nid]
+        return None
+
     def __contains__(self, node):
-        return node in self.cache
+        nid = self._id.get(node)
+        return nid is not None and bool(self.cache[nid])
 
 class LeastWeightedCache(Cache):
     def __init__(self, capacity):
         super().__init__(capacity)
-        self.cache = {}
+        self.cache = set()
         self.freq = defaultdict(int)
-    
+        # Min-heap of (weight, tiebreak, id) entries with lazy deletion;
+        # weights move by arbitrary deltas so the heap variant is used here
+        self.heap = []
+        self.counter = count()
+        self._indeg = []
+
     def clear(self):
         self.cache.clear()
         self.freq.clear()
-    
+        self.heap.clear()
+
     def initialize(self, graph):
         self.cache.clear()
         self.freq.clear()
+        self.heap.clear()
         super().initialize(graph)
-        # cache `capacity` random nodes
-        for node in random.sample(sorted(graph.nodes), min(self.capacity, len(graph.nodes))):
-            self.cache[node] = None
-            self.freq[node] = 0
+        # in-degrees are read on every hit and miss; snapshot them once
+        # (degree views iterate in node order, matching the id mapping)
+        self._indeg = [degree for _, degree in graph.in_degree()]
+        # cache `capacity` random node ids
+        ids = range(len(self._id))
+        for nid in random.sample(ids, min(self.capacity, len(ids))):
+            self.cache.add(nid)
+            self.freq[nid] = 0
+            heappush(self.heap, (0, next(self.counter), nid))
 
     def query(self, node):
-        if node in self.cache:
+        nid = self._id[node]
+        cache = self.cache
+        freq = self.freq
+        size = self._sizes[nid]
+        if nid in cache:
             # Cache hit
-            self.hits += self.graph.nodes[node]['size']
-            # Increment the frequency of the node by 'size'
-            self.freq[node] += self.graph.nodes[node]['size'] * self.graph.in_degree[node]
-            return self.cache[node]
+            self.hits += size
+            # Increment the weight of the node by 'size' * in-degree
+            new_weight = freq[nid] + size * self._indeg[nid]
+            freq[nid] = new_weight
+            heappush(self.heap, (new_weight, next(self.counter), nid))
+            return None
         else:
             # Cache miss
-            self.misses += self.graph.nodes[node]['size']
-            if len(self.cache) >= self.capacity:
-                # Find the least frequently used node
-                lfu_node = min(self.freq, key=self.freq.get)
-                # Remove it from the cache and frequency dictionary
-                del self.cache[lfu_node]
-                del self.freq[lfu_node]
-            # Add the new node to the cache and set its frequency to 'size'
-            self.cache[node] = None
-            self.freq[node] = self.graph.nodes[node]['size'] * self.graph.in_degree[node]
-            return self.cache[node]
-    
+            self.misses += size
+            if len(cache) >= self.capacity:
+                # Pop until we find a live entry for the least weighted node
+                heap = self.heap
+                while heap:
+                    stale_weight, _, lw_nid = heappop(heap)
+                    if freq.get(lw_nid) == stale_weight:
+                        # Remove it from the cache and frequency dictionary
+                        cache.discard(lw_nid)
+                        del freq[lw_nid]
+                        break
+            # Add the new node to the cache and set its weight to 'size' * in-degree
+            weight = size * self._indeg[nid]
+            cache.add(nid)
+            freq[nid] = weight
+            heappush(self.heap, (weight, next(self.counter), nid))
+            return None
+
     def __contains__(self, node):
-        return node in self.cache
+        nid = self._id.get(node)
+        return nid is not None and nid in self.cache
 
 class StaticTopKSizeCache(Cache):
     def __init__(self, capacity):
         super().__init__(capacity)
-        self.cache = {}
-    
+        self.cache = np.zeros(0, dtype=bool)
+
     def clear(self):
-        self.cache.clear()
-    
+        self.cache.fill(False)
+
     def initialize(self, graph):
-        self.cache.clear()
         super().initialize(graph)
+        self.cache = np.zeros(len(self._id), dtype=bool)
         # cache the top capacity nodes by size
-        for node, size in sorted(nx.get_node_attributes(self.graph, 'size').items(), key=lambda x: x[1], reverse=True)[:self.capacity]:
-            self.cache[node] = None
+        for node, size in nlargest(self.capacity, nx.get_node_attributes(self.graph, 'size').items(), key=lambda x: x[1]):
+            self.cache[self._id[node]] = True
 
     def query(self, node):
-        if node in self.cache:
+        nid = self._id[node]
+        if self.cache[nid]:
             # Cache hit
-            self.hits += self.graph.nodes[node]['size']
-            return self.cache[node]
+            self.hits += self._sizes[nid]
         else:
             # Cache miss
-            self.misses += self.graph.nodes[node]['size']
-            return None
+            self.misses += self._sizes[nid]
+        return None
 
     def __contains__(self, node):
-        return node in self.cache
+        nid = self._id.get(node)
+        return nid is not None and bool(self.cache[nid])
 
 class CompositeCache(Cache):
     def __init__(self, capacity):
@@ -258,36 +328,264 @@ class CompositeCache(Cache):
         dynamicCapacities = [capacity // 4, capacity - (capacity // 4)]
         self.dynamicCaches = [CacheType(dynamicCapacities[i]) for i, CacheType in enumerate([LeastWeightedCache, LRUCache])]
         self.caches = self.staticCaches + self.dynamicCaches
-    
+        # Cached fallback weight vector; recomputed every WEIGHT_REFRESH picks
+        # since per-cache hit rates drift slowly between queries
+        self.WEIGHT_REFRESH = 256
+        self._weights = None
+        self._weights_age = 0
+        # Running totals over all sub-caches so hit_rate is O(1) instead of
+        # summing every sub-cache's counters per call
+        self._total_hits = 0
+        self._total_misses = 0
+
     def clear(self):
         for cache in self.caches:
             cache.clear()
-    
+        self._weights = None
+        self._weights_age = 0
+
     def reset(self):
         for cache in self.caches:
             cache.reset()
-    
+        self._weights = None
+        self._weights_age = 0
+        self._total_hits = 0
+        self._total_misses = 0
+
     def initialize(self, graph):
         super().initialize(graph)
         self.clear()
         for cache in self.caches:
             cache.initialize(graph)
-    
+
     def hit_rate(self):
-        total = sum(cache.hits + cache.misses for cache in self.caches)
-        return sum(cache.hits for cache in self.caches) / total if total > 0 else 0
+        total = self._total_hits + self._total_misses
+        return self._total_hits / total if total > 0 else 0
+
+    def _dispatch(self, cache, node):
+        # Route the query to a sub-cache and fold its counter deltas into
+        # the running totals
+        hits, misses = cache.hits, cache.misses
+        result = cache.query(node)
+        self._total_hits += cache.hits - hits
+        self._total_misses += cache.misses - misses
+        return result
 
     def query(self, node):
         for cache in self.staticCaches:
             if node in cache:
-                return cache.query(node)
+                return self._dispatch(cache, node)
         else:
             for cache in self.dynamicCaches:
                 if node in cache:
-                    return cache.query(node)
+                    return self._dispatch(cache, node)
         # cache <- weighted random choice of caches based on hit rate
-        cache = random.choices(self.caches, weights=[cache.hit_rate() + 0.00001 for cache in self.caches])[0]
-        return cache.query(node)
-    
+        if self._weights is None or self._weights_age >= self.WEIGHT_REFRESH:
+            self._weights = [cache.hit_rate() + 0.00001 for cache in self.caches]
+            self._weights_age = 0
+        self._weights_age += 1
+        cache = random.choices(self.caches, weights=self._weights)[0]
+        return self._dispatch(cache, node)
+
     def __contains__(self, node):
-        return any(node in cache for cache in self.caches)
\ No newline at end of file
+        return any(node in cache for cache in self.caches)
+
+if njit is not None:
+    @njit(cache=True)
+    def _lru_trace_kernel(trace, sizes, capacity, initial, n_nodes):
+        # Array-backed doubly-linked list over node ids: head is the LRU end,
+        # tail the MRU end. The whole trace runs without touching the interpreter.
+        prev = np.full(n_nodes, -1, np.int32)
+        nxt = np.full(n_nodes, -1, np.int32)
+        in_cache = np.zeros(n_nodes, np.uint8)
+        head = np.int32(-1)
+        tail = np.int32(-1)
+        cached = 0
+        hits = 0.0
+        misses = 0.0
+        for i in range(initial.shape[0]):
+            nid = initial[i]
+            in_cache[nid] = 1
+            if tail == -1:
+                head = nid
+            else:
+                nxt[tail] = nid
+                prev[nid] = tail
+            tail = nid
+            cached += 1
+        for i in range(trace.shape[0]):
+            nid = trace[i]
+            if in_cache[nid] == 1:
+                hits += sizes[nid]
+                if tail != nid:
+                    # Unlink and relink at the MRU end
+                    p = prev[nid]
+                    q = nxt[nid]
+                    if p != -1:
+                        nxt[p] = q
+                    else:
+                        head = q
+                    if q != -1:
+                        prev[q] = p
+                    prev[nid] = tail
+                    nxt[nid] = -1
+                    nxt[tail] = nid
+                    tail = nid
+            else:
+                misses += sizes[nid]
+                if cached >= capacity:
+                    # Evict the LRU end
+                    evicted = head
+                    head = nxt[evicted]
+                    if head != -1:
+                        prev[head] = -1
+                    else:
+                        tail = np.int32(-1)
+                    in_cache[evicted] = 0
+                    nxt[evicted] = -1
+                    cached -= 1
+                in_cache[nid] = 1
+                prev[nid] = tail
+                nxt[nid] = -1
+                if tail != -1:
+                    nxt[tail] = nid
+                else:
+                    head = nid
+                tail = nid
+                cached += 1
+        # Walk the list LRU -> MRU so the caller can rebuild its OrderedDict
+        order = np.empty(cached, np.int32)
+        nid = head
+        for i in range(cached):
+            order[i] = nid
+            nid = nxt[nid]
+        return hits, misses, order
+
+    @njit(cache=True)
+    def _lfu_trace_kernel(trace, sizes, capacity, initial, initial_freq, n_nodes):
+        # Same lazy-deletion min-heap as LFUCache.query, laid out as parallel
+        # arrays; every push is one slot write plus a sift-up
+        freq = np.zeros(n_nodes, np.int64)
+        in_cache = np.zeros(n_nodes, np.uint8)
+        heap_cap = trace.shape[0] + initial.shape[0] + 1
+        heap_freq = np.empty(heap_cap, np.int64)
+        heap_tie = np.empty(heap_cap, np.int64)
+        heap_nid = np.empty(heap_cap, np.int32)
+        heap_size = 0
+        tie = 0
+        cached = 0
+        hits = 0.0
+        misses = 0.0
+        for i in range(initial.shape[0]):
+            nid = initial[i]
+            in_cache[nid] = 1
+            freq[nid] = initial_freq[i]
+            cached += 1
+            heap_freq[heap_size] = initial_freq[i]
+            heap_tie[heap_size] = tie
+            heap_nid[heap_size] = nid
+            tie += 1
+            j = heap_size
+            heap_size += 1
+            while j > 0:
+                parent = (j - 1) // 2
+                if (heap_freq[j], heap_tie[j]) < (heap_freq[parent], heap_tie[parent]):
+                    heap_freq[j], heap_freq[parent] = heap_freq[parent], heap_freq[j]
+                    heap_tie[j], heap_tie[parent] = heap_tie[parent], heap_tie[j]
+                    heap_nid[j], heap_nid[parent] = heap_nid[parent], heap_nid[j]
+                    j = parent
+                else:
+                    break
+        for i in range(trace.shape[0]):
+            nid = trace[i]
+            if in_cache[nid] == 1:
+                hits += sizes[nid]
+                freq[nid] += 1
+            else:
+                misses += sizes[nid]
+                if cached >= capacity:
+                    # Pop until a live entry surfaces, then evict it
+                    while heap_size > 0:
+                        top_freq = heap_freq[0]
+                        top_nid = heap_nid[0]
+                        heap_size -= 1
+                        heap_freq[0] = heap_freq[heap_size]
+                        heap_tie[0] = heap_tie[heap_size]
+                        heap_nid[0] = heap_nid[heap_size]
+                        j = 0
+                        while True:
+                            smallest = j
+                            left = 2 * j + 1
+                            right = left + 1
+                            if left < heap_size and (heap_freq[left], heap_tie[left]) < (heap_freq[smallest], heap_tie[smallest]):
+                                smallest = left
+                            if right < heap_size and (heap_freq[right], heap_tie[right]) < (heap_freq[smallest], heap_tie[smallest]):
+                                smallest = right
+                            if smallest == j:
+                                break
+                            heap_freq[j], heap_freq[smallest] = heap_freq[smallest], heap_freq[j]
+                            heap_tie[j], heap_tie[smallest] = heap_tie[smallest], heap_tie[j]
+                            heap_nid[j], heap_nid[smallest] = heap_nid[smallest], heap_nid[j]
+                            j = smallest
+                        if in_cache[top_nid] == 1 and freq[top_nid] == top_freq:
+                            in_cache[top_nid] = 0
+                            freq[top_nid] = 0
+                            cached -= 1
+                            break
+                in_cache[nid] = 1
+                freq[nid] = 1
+                cached += 1
+            # Record the node's current frequency (live heap entry)
+            heap_freq[heap_size] = freq[nid]
+            heap_tie[heap_size] = tie
+            heap_nid[heap_size] = nid
+            tie += 1
+            j = heap_size
+            heap_size += 1
+            while j > 0:
+                parent = (j - 1) // 2
+                if (heap_freq[j], heap_tie[j]) < (heap_freq[parent], heap_tie[parent]):
+                    heap_freq[j], heap_freq[parent] = heap_freq[parent], heap_freq[j]
+                    heap_tie[j], heap_tie[parent] = heap_tie[parent], heap_tie[j]
+                    heap_nid[j], heap_nid[parent] = heap_nid[parent], heap_nid[j]
+                    j = parent
+                else:
+                    break
+        return hits, misses, in_cache, freq
+
+def simulate_trace(cache, queries):
+    '''
+    Run a whole query trace through `cache` and return (hits, misses) for the
+    trace. Equivalent to calling cache.query(node) for every node in `queries`,
+    but for LRUCache and LFUCache the loop runs inside a compiled Numba kernel
+    over int32 id arrays when numba is installed, avoiding a Python dispatch
+    per query. The cache's counters and contents are updated either way.
+    '''
+    start_hits, start_misses = cache.hits, cache.misses
+    if njit is not None and type(cache) in (LRUCache, LFUCache):
+        trace = np.fromiter((cache._id[node] for node in queries), dtype=np.int32, count=len(queries))
+        sizes = np.asarray(cache._sizes, dtype=np.float64)
+        if type(cache) is LRUCache:
+            # OrderedDict iterates LRU -> MRU, which is the seeding order the
+            # kernel expects
+            initial = np.fromiter(cache.cache, dtype=np.int32, count=len(cache.cache))
+            hits, misses, order = _lru_trace_kernel(trace, sizes, cache.capacity, initial, len(cache._id))
+            cache.cache = OrderedDict((int(nid), None) for nid in order)
+        else:
+            # The freq dict preserves insertion chronology, keeping eviction
+            # tie-breaking consistent with the per-query path
+            initial = np.fromiter(cache.freq.keys(), dtype=np.int32, count=len(cache.freq))
+            initial_freq = np.fromiter(cache.freq.values(), dtype=np.int64, count=len(cache.freq))
+            hits, misses, in_cache, freq = _lfu_trace_kernel(trace, sizes, cache.capacity, initial, initial_freq, len(cache._id))
+            cache.cache = {int(nid) for nid in np.nonzero(in_cache)[0]}
+            cache.freq = defaultdict(int, {nid: int(freq[nid]) for nid in cache.cache})
+            cache.heap = []
+            for nid, f in cache.freq.items():
+                heappush(cache.heap, (f, next(cache.counter), nid))
+        cache.hits += hits
+        cache.misses += misses
+        return hits, misses
+    query = cache.query
+    for node in queries:
+        query(node)
+    return cache.hits - start_hits, cache.misses - start_misses
